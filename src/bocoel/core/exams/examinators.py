@@ -1,6 +1,7 @@
-from collections import OrderedDict
 from collections.abc import Mapping
 
+import numpy as np
+from numpy.typing import NDArray
 from pandas import DataFrame
 
 from bocoel.core.exams.interfaces import Exam
@@ -21,14 +22,15 @@ class Examinator:
     def __init__(self, exams: Mapping[str, Exam]) -> None:
         self.exams = exams
 
-    def examine(self, index: Index, results: OrderedDict[int, float]) -> DataFrame:
+    def examine(self, index: Index, indices: NDArray, scores: NDArray) -> DataFrame:
         """
-        Perform the exams on the results.
-        This method looks up results in the index and runs the exams on the results.
+        Perform the exams on the optimizer results.
+        This method looks up results in the index and runs the exams on them.
 
         Parameters:
             index: The index of the results.
-            results: The results.
+            indices: The corpus indices visited by the optimizer, in step order.
+            scores: The scores generated by the optimizer, in step order.
 
         Returns:
             The scores of the exams.
@@ -38,12 +40,12 @@ class Examinator:
             Currently the exams are run sequentially and can be slow.
         """
 
-        scores = {k: v.run(index, results) for k, v in self.exams.items()}
+        outcomes = {k: v.run(index, indices, scores) for k, v in self.exams.items()}
         original = {
-            exams.STEP_IDX: list(range(len(results))),
-            exams.ORIGINAL: list(results.values()),
+            exams.STEP_IDX: np.arange(len(scores)),
+            exams.ORIGINAL: scores,
         }
-        return DataFrame.from_dict({**original, **scores})
+        return DataFrame.from_dict({**original, **outcomes})
 
     @classmethod
     def presets(cls) -> "Examinator":
@@ -1,5 +1,4 @@
 import abc
-from collections import OrderedDict
 from typing import Protocol
 
 from numpy.typing import NDArray
@@ -13,39 +12,41 @@ class Exam(Protocol):
     using a particular set of results generated by the optimizer.
     """
 
-    def run(self, index: Index, results: OrderedDict[int, float]) -> NDArray:
+    def run(self, index: Index, indices: NDArray, scores: NDArray) -> NDArray:
         """
-        Run the exam on the given index and results.
+        Run the exam on the given index and optimizer results.
 
         Parameters:
             index: The index to evaluate.
-            results: The results generated by the optimizer.
+            indices: The corpus indices visited by the optimizer, in step order.
+            scores: The scores generated by the optimizer, in step order.
 
         Returns:
-            The scores for each entry in the index. The length must be the same as the results.
+            The scores for each entry in the index. The length must be the same as the scores.
         """
 
-        outcome = self._run(index=index, results=results)
+        outcome = self._run(index=index, indices=indices, scores=scores)
 
-        if len(outcome) != len(results):
+        if len(outcome) != len(scores):
             raise ValueError(
                 f"Length of outcome ({len(outcome)}) must be the same as "
-                f"the length of results ({len(results)})"
+                f"the length of scores ({len(scores)})"
             )
 
         return outcome
 
     @abc.abstractmethod
-    def _run(self, index: Index, results: OrderedDict[int, float]) -> NDArray:
+    def _run(self, index: Index, indices: NDArray, scores: NDArray) -> NDArray:
         """
-        Run the exam on the given index and results.
+        Run the exam on the given index and optimizer results.
 
         Parameters:
             index: The index to evaluate.
-            results: The results generated by the optimizer.
+            indices: The corpus indices visited by the optimizer, in step order.
+            scores: The scores generated by the optimizer, in step order.
 
         Returns:
-            The scores for each entry in the index. The length must be the same as the results.
+            The scores for each entry in the index. The length must be the same as the scores.
         """
 
         ...
@@ -1,12 +1,17 @@
+import dataclasses
 import datetime as dt
+import functools
 import hashlib
 import itertools
-from collections import OrderedDict
-from collections.abc import Generator, Mapping
+import sys
+import weakref
+from collections.abc import Generator, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import alive_progress as ap
+import numpy as np
 import pandas as pd
 import structlog
 from pandas import DataFrame
@@ -21,6 +26,22 @@ from .examinators import Examinator
 LOGGER = structlog.get_logger()
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class RunIdentity:
+    """
+    The pre-stringified components identifying a single run.
+    Built once per save so that the digest and the identifier columns
+    share a single stringification pass.
+    """
+
+    optimizer: str
+    embedder: str
+    index: str
+    storage: str
+    model: str
+    adaptor: str
+
+
 class Manager:
     """
     The manager for running and saving evaluations.
@@ -102,14 +123,22 @@ class Manager:
             return self.load(self.root / md5)
 
         # Run the optimizer and collect the results.
+        # Append to flat lists during the run and materialize once at the end,
+        # instead of merging every step into a dict.
         LOGGER.info("Running the optimizer", steps=steps)
-        results: OrderedDict[int, float] = OrderedDict()
+        indices: list[int] = []
+        values: list[float] = []
         for res in self._launch(optimizer=optimizer, steps=steps):
-            results.update(res)
+            indices.extend(res.keys())
+            values.extend(res.values())
 
         # Examine the results.
         LOGGER.info("Examing the results")
-        scores = self._examinator.examine(index=corpus.index, results=results)
+        scores = self._examinator.examine(
+            index=corpus.index,
+            indices=np.fromiter(indices, dtype=np.int64, count=len(indices)),
+            scores=np.fromiter(values, dtype=np.float32, count=len(values)),
+        )
 
         self.save(
             scores=scores,
@@ -155,20 +184,33 @@ class Manager:
             LOGGER.warning("No path set to save the scores. Skip")
             return
 
+        identity = self._identity(
+            optimizer=optimizer,
+            embedder=embedder,
+            corpus=corpus,
+            model=model,
+            adaptor=adaptor,
+        )
+
         scores = self.with_cols(
             scores,
             {
-                columns.OPTIMIZER: optimizer,
-                columns.MODEL: model,
-                columns.ADAPTOR: adaptor,
-                columns.INDEX: corpus.index,
-                columns.STORAGE: corpus.storage,
-                columns.EMBEDDER: embedder,
+                columns.OPTIMIZER: identity.optimizer,
+                columns.MODEL: identity.model,
+                columns.ADAPTOR: identity.adaptor,
+                columns.INDEX: identity.index,
+                columns.STORAGE: identity.storage,
+                columns.EMBEDDER: identity.embedder,
                 columns.TIME: self._start,
                 columns.MD5: md5,
             },
         )
 
+        # Most exam columns are float32 already; downcast the stragglers
+        # (e.g. the average accumulation) so the table stays half-width.
+        float64_cols = scores.select_dtypes(include="float64").columns
+        scores = scores.astype({col: "float32" for col in float64_cols})
+
         (self.root / md5).mkdir(exist_ok=True)
         scores.to_csv(self.root / md5 / f"{self._start}.csv", index=False)
 
@@ -184,12 +226,18 @@ class Manager:
             The md5 hash of the identifier columns and the DataFrame with the columns added.
         """
 
-        df = df.copy()
-
-        for key, value in columns.items():
-            df[key] = [str(value)] * len(df)
+        # A single assign broadcasts the scalars over the frame,
+        # rather than materializing a length `len(df)` list per column.
+        # It also copies the frame, so no explicit copy is needed.
+        df = df.assign(**{key: _cached_str(value) for key, value in columns.items()})
 
-        return df
+        # Arrow strings use a fraction of the memory of object columns
+        # and serialize to csv without a Python str call per row.
+        try:
+            return df.astype({key: "string[pyarrow]" for key in columns})
+        except ImportError:
+            # Optional dependency pyarrow is not installed.
+            return df
 
     @staticmethod
     def _launch(
@@ -197,9 +245,16 @@ class Manager:
     ) -> Generator[Mapping[int, float], None, None]:
         "Launches the optimizer as a generator."
 
-        steps_range = range(steps) if steps is not None else itertools.count()
+        steps_range: Iterable[int] = (
+            range(steps) if steps is not None else itertools.count()
+        )
+
+        # Progress rendering costs real time per step,
+        # and displays nothing without a terminal (CI, piped logs).
+        if sys.stdout.isatty():
+            steps_range = ap.alive_it(steps_range, title="Running the optimizer")
 
-        for _ in ap.alive_it(steps_range, title="Running the optimizer"):
+        for _ in steps_range:
             # Raises StopIteration (converted to RuntimError per PEP 479) if done.
             try:
                 results = optimizer.step()
@@ -225,12 +280,28 @@ class Manager:
         """
 
         # Iterate over all csv files in the path.
-        dfs = [pd.read_csv(csv) for csv in Path(path).rglob(f"*.csv")]
+        paths = list(Path(path).rglob(f"*.csv"))
 
-        if not dfs:
+        if not paths:
             raise ValueError(f"No csv files found in {path}")
 
-        return pd.concat(dfs)
+        try:
+            # Optional dependency.
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            return pd.concat([pd.read_csv(csv) for csv in paths])
+
+        # Pyarrow parses each file with multiple threads,
+        # and the pool overlaps reads across files.
+        with ThreadPoolExecutor() as executor:
+            tables = list(executor.map(pacsv.read_csv, paths))
+
+        # Mapping to ArrowDtype keeps the identifier columns as arrow
+        # string buffers instead of allocating one Python str per row.
+        return pa.concat_tables(tables, promote_options="default").to_pandas(
+            self_destruct=True, types_mapper=pd.ArrowDtype
+        )
 
     @staticmethod
     def md5(
@@ -256,12 +327,113 @@ class Manager:
             The md5 hash of the given data.
         """
 
-        data = [optimizer, embedder, corpus.index, corpus.storage, model, adaptor]
+        identity = Manager._identity(
+            optimizer=optimizer,
+            embedder=embedder,
+            corpus=corpus,
+            model=model,
+            adaptor=adaptor,
+        )
+
+        return _digest(identity)
+
+    @staticmethod
+    def _identity(
+        *,
+        optimizer: Optimizer,
+        embedder: Embedder,
+        corpus: Corpus,
+        model: GenerativeModel | ClassifierModel,
+        adaptor: Adaptor,
+    ) -> RunIdentity:
+        """
+        Builds the identity of a run from its components.
+        Stringification goes through the repr cache,
+        so each component is only ever stringified once.
+
+        Parameters:
+            optimizer: The optimizer used to generate the scores.
+            embedder: The embedder used to generate the scores.
+            corpus: The corpus used to generate the scores.
+            model: The model used to generate the scores.
+            adaptor: The adaptor used to generate the scores.
 
-        return hashlib.md5(
-            str.encode(" ".join([str(item) for item in data]))
-        ).hexdigest()
+        Returns:
+            The pre-stringified identity.
+        """
+
+        return RunIdentity(
+            optimizer=_cached_str(optimizer),
+            embedder=_cached_str(embedder),
+            index=_cached_str(corpus.index),
+            storage=_cached_str(corpus.storage),
+            model=_cached_str(model),
+            adaptor=_cached_str(adaptor),
+        )
 
     @staticmethod
     def current() -> str:
         return dt.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+
+
+_STR_CACHE: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def _cached_str(obj: Any, /) -> str:
+    """
+    Stringifies the object, memoizing the result per object.
+
+    Reprs of optimizers and storages can be expensive to build,
+    and the save path stringifies the same objects on every call.
+    Weak references are held so that entries die with their objects.
+    Objects that cannot be weakly referenced (e.g. plain strings)
+    are stringified directly.
+
+    Parameters:
+        obj: The object to stringify.
+
+    Returns:
+        The string representation of the object.
+    """
+
+    try:
+        return _STR_CACHE[obj]
+    except (KeyError, TypeError):
+        pass
+
+    result = str(obj)
+
+    try:
+        _STR_CACHE[obj] = result
+    except TypeError:
+        pass
+
+    return result
+
+
+@functools.lru_cache(maxsize=128)
+def _digest(identity: RunIdentity, /) -> str:
+    """
+    Hashes the run identity into a hex digest for use as a filename.
+
+    Blake2b is used over md5 since it is faster on modern hardware,
+    and collision resistance is irrelevant for a filename.
+    The fields are streamed into the hasher one at a time,
+    so no joined copy of the (potentially long) reprs is materialized.
+    The digest is cached since the same components are hashed on every save,
+    keyed on the identity, which is hashable since it is frozen.
+
+    Parameters:
+        identity: The pre-stringified identity of the run.
+
+    Returns:
+        The hex digest of the identity.
+    """
+
+    hasher = hashlib.blake2b(digest_size=16)
+
+    for field in dataclasses.astuple(identity):
+        hasher.update(field.encode())
+        hasher.update(b" ")
+
+    return hasher.hexdigest()
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from collections.abc import Callable
 
 import numpy as np
@@ -44,13 +43,12 @@ class Accumulation(Exam):
             case _:
                 raise ValueError(f"Unknown accumulation type {typ}")
 
-    def _run(self, index: Index, results: OrderedDict[int, float]) -> NDArray:
-        LOGGER.info("Running Accumulation exam", num_results=len(results))
+    def _run(self, index: Index, indices: NDArray, scores: NDArray) -> NDArray:
+        LOGGER.info("Running Accumulation exam", num_scores=len(scores))
 
-        _ = index
+        _ = index, indices
 
-        values = np.array(list(results.values()))
-        return self._acc(values, self._acc_func)
+        return self._acc(scores, self._acc_func)
 
     @staticmethod
     def _acc(array: NDArray, accumulate: Callable[[NDArray], NDArray]) -> NDArray:
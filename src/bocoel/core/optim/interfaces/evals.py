@@ -95,11 +95,12 @@ class CachedIndexEvaluator(IndexEvaluator):
             raise ValueError(f"Expected 1D array, got {idx.ndim}D")
 
         # Only compute the previously unseen indices.
-        unseen = [i for i in idx if i not in self._cache]
+        # Deduplicate (preserving order) so that repeats within a batch
+        # are only ever evaluated once.
+        unseen = [i for i in dict.fromkeys(idx.tolist()) if i not in self._cache]
 
         if unseen:
             results = self._index_eval(unseen)
-            mapped_results = dict(zip(unseen, results))
-            self._cache |= mapped_results
+            self._cache.update(zip(unseen, results))
 
-        return np.array([self._cache[i] for i in idx])
+        return np.array([self._cache[i] for i in idx.tolist()])
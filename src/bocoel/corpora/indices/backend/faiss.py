@@ -1,23 +1,30 @@
-import functools
 import warnings
 from typing import Any
 
+import numpy as np
 from numpy.typing import NDArray
 
 from bocoel.corpora.indices import utils
 from bocoel.corpora.indices.interfaces import Distance, Index, InternalResult
 
+_faiss_module: Any = None
 
-@functools.cache
-def _faiss():
-    # Optional dependency.
-    # Faiss also spits out deprecation warnings.
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-        import faiss
+def _faiss() -> Any:
+    # Optional dependency, imported once and bound at module level,
+    # so that hot paths pay a global lookup rather than a wrapped call.
+    global _faiss_module
 
-    return faiss
+    if _faiss_module is None:
+        # Faiss also spits out deprecation warnings.
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+            import faiss
+
+        _faiss_module = faiss
+
+    return _faiss_module
 
 
 class FaissIndex(Index):
@@ -46,8 +53,13 @@ class FaissIndex(Index):
             batch_size: The batch size to use for searching.
         """
 
+        # Faiss requires float32. Copying into a private buffer here
+        # also means normalization can run in place on that buffer,
+        # instead of allocating yet another full-size array.
+        embeddings = np.array(embeddings, dtype=np.float32)
+
         if normalize:
-            embeddings = utils.normalize(embeddings)
+            utils.normalize(embeddings, out=embeddings)
 
         self.__embeddings = embeddings
 
@@ -76,30 +88,62 @@ class FaissIndex(Index):
     def dims(self) -> int:
         return self.__embeddings.shape[1]
 
+    def _search_batched(self, query: NDArray, k: int = 1) -> InternalResult:
+        # Faiss handles arbitrary batch sizes natively,
+        # so the whole batch goes through a single search call,
+        # rather than one pybind round trip (and on GPU, one kernel launch)
+        # per `batch` sized chunk.
+        return self._search(query, k=k)
+
     def _search(self, query: NDArray, k: int = 1) -> InternalResult:
-        distances, indices = self._index.search(query, k)
+        # Faiss copies non-contiguous or non-float32 queries on every call,
+        # allocating a fresh staging array each time. Conforming queries are
+        # passed straight through; others are staged in a preallocated
+        # buffer. The buffer is shared across calls, so searches on a single
+        # index must not run concurrently.
+        if query.dtype == np.float32 and query.flags.c_contiguous:
+            staged = query
+        elif len(query) <= len(self._query_buffer):
+            staged = self._query_buffer[: len(query)]
+            np.copyto(staged, query)
+        else:
+            staged = np.ascontiguousarray(query, dtype=np.float32)
+
+        distances, indices = self._index.search(staged, k)
         return InternalResult(distances=distances, indices=indices)
 
     def _init_index(self, index_string: str, cuda: bool) -> None:
+        faiss = _faiss()
         metric = self._faiss_metric(self.distance)
 
         # Using Any as type hint to prevent errors coming up in add / search.
         # Faiss is not type check ready yet.
         # https://github.com/facebookresearch/faiss/issues/2891
 
-        index: Any = _faiss().index_factory(self.dims, index_string, metric)
-        index.train(self.data)
+        index: Any = faiss.index_factory(self.dims, index_string, metric)
+
+        # Flat indices come out of the factory already trained,
+        # so skip the pointless sweep over the embeddings.
+        if not index.is_trained:
+            index.train(self.data)
+
         index.add(self.data)
 
         if cuda:
-            index = _faiss().index_cpu_to_all_gpus(index)
+            # Float16 halves the bandwidth needed to stream the index on GPU.
+            options = faiss.GpuMultipleClonerOptions()
+            options.useFloat16 = True
+            index = faiss.index_cpu_to_all_gpus(index, co=options)
 
         self._index = index
+        self._query_buffer = np.empty((self._batch_size, self.dims), dtype=np.float32)
 
     @staticmethod
     def _faiss_metric(distance: Distance) -> Any:
+        faiss = _faiss()
+
         match distance:
             case Distance.L2:
-                return _faiss().METRIC_L2
+                return faiss.METRIC_L2
             case Distance.INNER_PRODUCT:
-                return _faiss().METRIC_INNER_PRODUCT
+                return faiss.METRIC_INNER_PRODUCT
@@ -74,18 +74,14 @@ class Index(Protocol):
         if k < 1:
             raise ValueError(f"Expected k to be at least 1, got {k}")
 
-        results: list[InternalResult] = []
-        for idx in range(0, len(query), self.batch):
-            query_batch = query[idx : idx + self.batch]
-            result = self._search(query_batch, k=k)
-            results.append(result)
-
-        indices = np.concatenate([res.indices for res in results], axis=0)
-        distances = np.concatenate([res.distances for res in results], axis=0)
-        vectors = self.data[indices]
+        result = self._search_batched(query, k=k)
+        vectors = self.data[result.indices]
 
         return SearchResultBatch(
-            query=query, vectors=vectors, distances=distances, indices=indices
+            query=query,
+            vectors=vectors,
+            distances=result.distances,
+            indices=result.indices,
         )
 
     def in_range(self, query: NDArray) -> bool:
@@ -144,6 +140,33 @@ class Index(Protocol):
 
         ...
 
+    def _search_batched(self, query: NDArray, k: int = 1) -> InternalResult:
+        """
+        Search the index with a batch of queries of arbitrary size.
+        By default the batch is split into `batch`-sized chunks,
+        searched one at a time, and the results concatenated.
+        Backends whose native search handles arbitrary batch sizes
+        may override this with a single fused call.
+
+        Parameters:
+            query: The query vectors. Must be of shape `[batch, query_dims]`.
+            k: The number of nearest neighbors to return.
+
+        Returns:
+            The internal result of the search.
+        """
+
+        results: list[InternalResult] = []
+        for idx in range(0, len(query), self.batch):
+            query_batch = query[idx : idx + self.batch]
+            result = self._search(query_batch, k=k)
+            results.append(result)
+
+        indices = np.concatenate([res.indices for res in results], axis=0)
+        distances = np.concatenate([res.distances for res in results], axis=0)
+
+        return InternalResult(distances=distances, indices=indices)
+
     @abc.abstractmethod
     def _search(self, query: NDArray, k: int = 1) -> InternalResult:
         """
@@ -18,13 +18,20 @@ def validate_embeddings(
         raise ValueError(f"Expected embeddings to be {d_str}, got {embeddings.ndim}D")
 
 
-def normalize(embeddings: ArrayLike, /, p: int = 2) -> NDArray:
-    embeddings = np.array(embeddings)
+def normalize(
+    embeddings: ArrayLike, /, p: int = 2, out: NDArray | None = None
+) -> NDArray:
+    embeddings = np.asarray(embeddings)
     validate_embeddings(embeddings, allowed_ndims=[1, 2])
 
     # Axis = -1 works for both 1D and 2D.
     norm = linalg.norm(embeddings, axis=-1, ord=p, keepdims=True)
-    return embeddings / norm
+
+    if out is None:
+        return embeddings / norm
+
+    # Writing into `out` allows normalizing a buffer in place.
+    return np.divide(embeddings, norm, out=out)
 
 
 def boundaries(embeddings: NDArray, /) -> Boundary:
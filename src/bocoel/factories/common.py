@@ -49,8 +49,49 @@ def auto_device_list(device: str, num_models: int, /) -> list[str]:
 
     if device_count:
         if device == "auto":
-            return [f"cuda:{i%device_count}" for i in range(num_models)]
+            free = _cuda_free_memory(device_count)
+
+            if free is None:
+                return [f"cuda:{i%device_count}" for i in range(num_models)]
+
+            # Greedily place each model on the device with the most free
+            # memory, debiting an equal share per placement,
+            # so that busy or smaller devices receive fewer models.
+            share = sum(free) // max(num_models, 1)
+            devices = []
+            for _ in range(num_models):
+                chosen = max(range(device_count), key=free.__getitem__)
+                devices.append(f"cuda:{chosen}")
+                free[chosen] -= share
+
+            return devices
         else:
             return [device] * num_models
     else:
         return ["cpu"] * num_models
+
+
+def _cuda_free_memory(device_count: int, /) -> list[int] | None:
+    """
+    The free memory of each cuda device via NVML,
+    or `None` if NVML is not available.
+    """
+
+    try:
+        # Optional dependency.
+        import pynvml
+    except ImportError:
+        return None
+
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return None
+
+    try:
+        handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(device_count)]
+        return [pynvml.nvmlDeviceGetMemoryInfo(handle).free for handle in handles]
+    except pynvml.NVMLError:
+        return None
+    finally:
+        pynvml.nvmlShutdown()
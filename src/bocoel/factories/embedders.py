@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from bocoel import Embedder, EnsembleEmbedder, HuggingfaceEmbedder, SbertEmbedder
 from bocoel.common import StrEnum
 
@@ -77,11 +79,19 @@ def embedder(
                 )
 
             device_list = common.auto_device_list(device, len(model_name))
-            return common.correct_kwargs(EnsembleEmbedder)(
-                [
-                    HuggingfaceEmbedder(path=model, device=dev, batch_size=batch_size)
-                    for model, dev in zip(model_name, device_list)
-                ]
-            )
+
+            # Loading weights is mostly disk IO and device copies,
+            # both of which release the GIL, so load the models in parallel.
+            with ThreadPoolExecutor(max_workers=len(model_name)) as executor:
+                embedders = list(
+                    executor.map(
+                        lambda md: HuggingfaceEmbedder(
+                            path=md[0], device=md[1], batch_size=batch_size
+                        ),
+                        zip(model_name, device_list),
+                    )
+                )
+
+            return common.correct_kwargs(EnsembleEmbedder)(embedders)
         case _:
             raise ValueError(f"Unknown embedder name: {name}")
@@ -4,6 +4,7 @@ from bocoel import (
     Adaptor,
     AxServiceOptimizer,
     BruteForceOptimizer,
+    CachedIndexEvaluator,
     Corpus,
     CorpusEvaluator,
     KMeansOptimizer,
@@ -79,5 +80,9 @@ def optimizer(
         case _:
             raise ValueError(f"Unknown optimizer name: {name}")
 
-    corpus_evaluator = CorpusEvaluator(corpus=corpus, adaptor=adaptor)
+    # Optimizers (especially Bayesian ones) revisit the same corpus entries
+    # over and over, so memoize evaluations by the resolved index.
+    corpus_evaluator = CachedIndexEvaluator(
+        CorpusEvaluator(corpus=corpus, adaptor=adaptor)
+    )
     return klass(index_eval=corpus_evaluator, index=corpus.index, **kwargs)
@@ -1,20 +1,48 @@
+import functools
+from collections.abc import Callable, Sequence
+
 import typeguard
 
 from .interfaces import Score
 
 
+@functools.lru_cache(maxsize=1024)
+def _reference_tokens(text: str, /) -> tuple[str, ...]:
+    # The same references are scored against many generations,
+    # so their tokenization is cached. Tuples since they are hashable
+    # and lru_cache entries must not be mutated.
+    return tuple(text.split())
+
+
 class NltkBleuScore(Score):
-    def __call__(self, target: str, references: list[str]) -> float:
-        typeguard.check_type("references", references, list[str])
+    def __init__(
+        self, smoothing_function: Callable[..., Sequence[float]] | None = None
+    ) -> None:
+        """
+        Parameters:
+            smoothing_function: The smoothing function to use.
+                Defaults to `SmoothingFunction().method7`.
+        """
 
         # Optional dependency.
         from nltk.translate import bleu_score
         from nltk.translate.bleu_score import SmoothingFunction
 
-        return bleu_score.sentence_bleu(
-            references=[ref.split() for ref in references],
+        # Built once at construction since both the smoother and its
+        # internal tables are reused across every call.
+        if smoothing_function is None:
+            smoothing_function = SmoothingFunction().method7
+
+        self._sentence_bleu = bleu_score.sentence_bleu
+        self._smoothing_function = smoothing_function
+
+    def __call__(self, target: str, references: list[str]) -> float:
+        typeguard.check_type("references", references, list[str])
+
+        return self._sentence_bleu(
+            references=[_reference_tokens(ref) for ref in references],
             hypothesis=target.split(),
-            smoothing_function=SmoothingFunction().method7,
+            smoothing_function=self._smoothing_function,
         )
 
 
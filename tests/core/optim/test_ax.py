@@ -1,6 +1,6 @@
 import pytest
 
-from bocoel import Manager, SbertEmbedder
+from bocoel import Corpus, GenerativeModel, Manager, SbertEmbedder
 from tests import utils
 from tests.corpora import factories as corpus_factories
 from tests.models.adaptors import factories as adaptor_factories
@@ -9,25 +9,46 @@ from tests.models.lms import factories as lm_factories
 from . import factories
 
 
-@pytest.mark.parametrize("device", utils.torch_devices())
+@pytest.fixture(scope="module", params=utils.torch_devices())
+def device(request: pytest.FixtureRequest) -> str:
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def embedder(device: str) -> SbertEmbedder:
+    return SbertEmbedder(device=device)
+
+
+@pytest.fixture(scope="module")
+def corpus(embedder: SbertEmbedder) -> Corpus:
+    return corpus_factories.corpus(embedder=embedder)
+
+
+@pytest.fixture(scope="module")
+def lm(device: str) -> GenerativeModel:
+    return lm_factories.generative_lm(device=device)
+
+
 @pytest.mark.parametrize("workers", [1, 2, 4])
 @pytest.mark.parametrize("score", ["sacre-bleu", "rouge-1", "exact-match"])
-def test_init_optimizer(device: str, workers: int, score: str) -> None:
-    embedder = SbertEmbedder(device=device)
-    corpus = corpus_factories.corpus(embedder=embedder)
-    lm = lm_factories.generative_lm(device=device)
+def test_init_optimizer(
+    device: str, corpus: Corpus, lm: GenerativeModel, workers: int, score: str
+) -> None:
     adaptor = adaptor_factories.bigbench_adaptor(name=score, lm=lm)
 
     _ = factories.ax_optim(corpus, lm, adaptor, device=device, workers=workers)
 
 
-@pytest.mark.parametrize("device", utils.torch_devices())
 @pytest.mark.parametrize("workers", [1, 2, 4])
 @pytest.mark.parametrize("score", ["sacre-bleu", "rouge-1", "exact-match"])
-def test_optimize(device: str, workers: int, score: str) -> None:
-    embedder = SbertEmbedder(device=device)
-    corpus = corpus_factories.corpus(embedder=embedder)
-    lm = lm_factories.generative_lm(device=device)
+def test_optimize(
+    device: str,
+    embedder: SbertEmbedder,
+    corpus: Corpus,
+    lm: GenerativeModel,
+    workers: int,
+    score: str,
+) -> None:
     adaptor = adaptor_factories.bigbench_adaptor(name=score, lm=lm)
     optimizer = factories.ax_optim(corpus, lm, adaptor, device=device, workers=workers)
 